@@ -1,10 +1,6 @@
 """Attempt at a special subclass of DnaOptimizationProblem for circular
 sequences. Needs more docs. See example in the examples folder.
 """
-from ..reports.optimization_reports import (
-    write_optimization_report,
-    write_no_solution_report,
-)
 from .DnaOptimizationProblem import DnaOptimizationProblem
 from .NoSolutionError import NoSolutionError
 from ..Location import Location
@@ -189,6 +185,13 @@ class CircularDnaOptimizationProblem(DnaOptimizationProblem):
           maybe no solution was found because the random searches were too
           short
         """
+        # Imported here so that "import dnachisel" does not load the
+        # (slow to import) reports dependencies.
+        from ..reports.optimization_reports import (
+            write_optimization_report,
+            write_no_solution_report,
+        )
+
         self.logger(message="Solving constraints")
         try:
             self.resolve_constraints()
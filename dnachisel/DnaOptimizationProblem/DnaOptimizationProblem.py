@@ -7,12 +7,8 @@ constraints, objectives.
 from Bio.SeqRecord import SeqRecord
 from proglog import default_bar_logger
 from ..Specification.SpecificationSet import SpecificationSet
-from ..biotools import sequences_differences_array
+from ..biotools import sequences_differences_array, SequenceViews
 from ..MutationSpace import MutationSpace
-from ..reports.optimization_reports import (
-    write_optimization_report,
-    write_no_solution_report,
-)
 from .NoSolutionError import NoSolutionError
 from . import mixins
 
@@ -111,6 +107,8 @@ class DnaOptimizationProblem(
     mutations_per_iteration = 2
     optimization_stagnation_tolerance = 100
     local_extensions = (0, 5)
+    _sequence_views = None
+    _previous_sequence_views = None
 
     def __init__(
         self,
@@ -194,6 +192,40 @@ class DnaOptimizationProblem(
         """
         self.sequence = new_sequence
 
+    @property
+    def sequence(self):
+        """The current sequence of the problem, e.g. "ATTGTGCA"."""
+        return self._sequence
+
+    @sequence.setter
+    def sequence(self, sequence):
+        # The last computed views are kept as the "previous" views of the
+        # next sequence (see ``sequence_views``).
+        if self._sequence_views is not None:
+            self._previous_sequence_views = self._sequence_views
+        self._sequence = sequence
+        self._sequence_views = None
+
+    def sequence_views(self):
+        """Return numerical views of the current sequence (uint8 codes, G/C
+        positions, 2-bit codes, etc.).
+
+        The views are computed on demand and shared by all specifications
+        evaluated on the problem, until the problem's sequence gets replaced.
+        See ``biotools.SequenceViews`` for the list of available views.
+
+        The views of the previously evaluated sequence of the problem are
+        attached to the new views, so that some specifications can update
+        their computations incrementally.
+        """
+        if self._sequence_views is None:
+            self._sequence_views = SequenceViews(
+                self._sequence,
+                previous=self._previous_sequence_views,
+            )
+            self._previous_sequence_views = None
+        return self._sequence_views
+
     def sequence_edits_as_array(self):
         """Return an array [False, False, True...] where True indicates an edit
         (i.e. a change at this position between the original problem sequence
@@ -235,6 +267,13 @@ class DnaOptimizationProblem(
           summary indication whether some clash was found, or some solution, or
           maybe no solution was found because the random searches were too short
         """
+        # Imported here so that "import dnachisel" does not load the
+        # (slow to import) reports dependencies.
+        from ..reports.optimization_reports import (
+            write_optimization_report,
+            write_no_solution_report,
+        )
+
         self.logger(message="Solving constraints")
         try:
             self.resolve_constraints()
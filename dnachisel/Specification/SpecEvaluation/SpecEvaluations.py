@@ -1,6 +1,5 @@
 from ...biotools import score_to_formatted_string
 from ...Location import Location
-from ...reports import colors_cycle
 
 
 class SpecEvaluations:
@@ -148,6 +147,8 @@ class SpecEvaluations:
 
         """
         if colors == "cycle":
+            from ...reports.colors_cycle import colors_cycle
+
             cycle = colors_cycle(
                 lightness_factor=self.color_lightness,
                 color_shift=self.color_shift,
@@ -10,6 +10,7 @@ from .genbank_operations import (
     annotate_record,
     annotate_differences,
     annotate_pattern_occurrences,
+    copy_record_for_annotation,
     write_record
 )
 
@@ -25,6 +26,19 @@ from .enzymes_operations import list_common_enzymes
 
 from .gc_content import gc_content
 
+from .sequences_encoding import (
+    sequence_to_uint8_array,
+    sequence_to_2bit_codes,
+    kmers_hashes,
+    canonical_kmers_hashes,
+    reverse_complement_uint8_array,
+    reverse_complement_2bit_codes,
+    pack_2bit_codes,
+    reverse_complement_packed,
+    SequenceViews,
+    MAX_PACKED_KMER_SIZE,
+)
+
 from .indices_operations import (
     group_nearby_indices,
     group_nearby_segments,
@@ -66,6 +80,7 @@ __all__ = [
     'annotate_record',
     'annotate_differences',
     'annotate_pattern_occurrences',
+    'copy_record_for_annotation',
     'complement',
     'reverse_complement',
     'reverse_translate',
@@ -73,6 +88,16 @@ __all__ = [
     'translate',
     'list_common_enzymes',
     'gc_content',
+    'sequence_to_uint8_array',
+    'sequence_to_2bit_codes',
+    'kmers_hashes',
+    'canonical_kmers_hashes',
+    'reverse_complement_uint8_array',
+    'reverse_complement_2bit_codes',
+    'pack_2bit_codes',
+    'reverse_complement_packed',
+    'SequenceViews',
+    'MAX_PACKED_KMER_SIZE',
     'get_backtranslation_table',
     'group_nearby_indices',
     'group_nearby_segments',
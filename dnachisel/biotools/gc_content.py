@@ -1,5 +1,7 @@
 import numpy as np
 
+from .sequences_encoding import sequence_to_uint8_array
+
 
 def gc_content(sequence, window_size=None):
     """Compute global or local GC content.
@@ -8,7 +10,9 @@ def gc_content(sequence, window_size=None):
     ----------
 
     sequence
-      An ATGC DNA sequence (upper case!)
+      An ATGC DNA sequence (upper case!), or a uint8 numpy array of the
+      ASCII codes of such a sequence (see ``sequence_to_uint8_array``), or a
+      boolean array indicating the positions of the G and C nucleotides.
 
     window_size
       If provided, the local GC content for the different sliding windows of
@@ -19,20 +23,32 @@ def gc_content(sequence, window_size=None):
 
       A number between 0 and 1 indication the proportion
       of GC content. If window_size is provided, returns
-      a list of len(sequence)-window_size values indicating
+      an array of len(sequence)-window_size+1 values indicating
       the local GC contents (sliding-window method). The i-th value
       indicates the GC content in the window [i, i+window_size]
     """
     # The code is a little cryptic as it uses numpy array operations
     # but the speed gain is 300x compared with pure-python string operations
 
-    arr = np.frombuffer((sequence + "").encode(), dtype="uint8")
-    arr_GCs = (arr == 71) | (arr == 67)  # 67=C, 71=G
+    if (window_size is None) and isinstance(sequence, (str, bytes)):
+        # Counting with CPython's C string routines is faster than encoding
+        # the sequence into an array, for the global GC content.
+        g, c = ("G", "C") if isinstance(sequence, str) else (b"G", b"C")
+        if len(sequence):
+            n_gc = sequence.count(g) + sequence.count(c)
+            return 1.0 * n_gc / len(sequence)
+
+    arr = sequence_to_uint8_array(sequence)
+    if arr.dtype == bool:
+        arr_GCs = arr
+    else:
+        arr_GCs = (arr == 71) | (arr == 67)  # 67=C, 71=G
 
     if window_size is None:
         return 1.0 * arr_GCs.sum() / len(sequence)
     else:
-        cs = np.cumsum(arr_GCs)
-        a = cs[window_size - 1 :]
-        b = np.hstack([[0], cs[:-window_size]])
-        return 1.0 * (a - b) / window_size
+        # Windows sums are differences of the prefix sums (with a leading 0),
+        # so that all windows are computed in a single pass.
+        cs = np.zeros(len(arr_GCs) + 1, dtype="int32")
+        np.cumsum(arr_GCs, out=cs[1:])
+        return (cs[window_size:] - cs[:-window_size]) / window_size
@@ -28,6 +28,31 @@ except ImportError:
         )
 
 
+def copy_record_for_annotation(record):
+    """Return a copy of the record to which new features can be added.
+
+    Unlike a deepcopy, the sequence and the features are shared with the
+    original record (only the features list and the annotations dict are
+    new), which is much faster for records with many features. The features
+    themselves should therefore not be modified in the copy. The ``linear``
+    attribute set by ``load_record`` is also kept.
+    """
+    new_record = SeqRecord(
+        record.seq,
+        id=record.id,
+        name=record.name,
+        description=record.description,
+        dbxrefs=list(record.dbxrefs),
+        features=list(record.features),
+        annotations=dict(record.annotations),
+        letter_annotations=dict(record.letter_annotations),
+    )
+    linear = getattr(record, "linear", None)
+    if linear is not None:
+        new_record.linear = linear
+    return new_record
+
+
 def load_record(filepath, linear=True, name="unnamed", file_format="auto"):
     """Load a FASTA/Genbank/Snapgene record.
 
@@ -91,7 +116,9 @@ def annotate_differences(record, reference, feature_type="misc_feature", prefix=
     """Annotate differences between two records in a new record.
 
     Returns a version of SeqRecord ``record`` where differences with the
-    references are annotated as new features.
+    references are annotated as new features. The returned record shares the
+    original features of ``record`` (the SeqFeature objects are not copied,
+    see ``copy_record_for_annotation``).
 
     Parameters
     ----------
@@ -122,7 +149,7 @@ def annotate_differences(record, reference, feature_type="misc_feature", prefix=
             locations[-1][-1] = ind
         else:
             locations.append([ind, ind])
-    new_record = deepcopy(record)
+    new_record = copy_record_for_annotation(record)
     for (start, end) in locations:
         annotate_record(
             new_record,
@@ -138,6 +165,9 @@ def annotate_pattern_occurrences(
 ):
     """Return a new record annotated w. all occurences of pattern in sequence.
 
+    The returned record shares the original features of ``record`` (the
+    SeqFeature objects are not copied, see ``copy_record_for_annotation``).
+
     Parameters
     -----------
     record
@@ -149,7 +179,7 @@ def annotate_pattern_occurrences(
     feature_type
       Type of the annotations in the returned record.
     """
-    new_record = deepcopy(record)
+    new_record = copy_record_for_annotation(record)
     label = prefix + str(pattern)
     for location in pattern.find_matches(str(record.seq)):
         annotate_record(
@@ -0,0 +1,103 @@
+"""Numba-compiled versions of some hot loops of DNA Chisel.
+
+Numba is an optional dependency. When it is not installed, NUMBA_AVAILABLE is
+False and the callers use their NumPy implementations instead. This module
+is only imported by the callers when needed, so that "import dnachisel" does
+not import Numba.
+"""
+
+import numpy as np
+
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True)
+    def canonical_kmers_hashes(codes, k, include_reverse_complement):
+        """Return the 2-bit packed hashes of all k-mers (k <= 32) of codes.
+
+        Forward and reverse-complement hashes are rolled in a single pass. If
+        include_reverse_complement is True, the smallest of the two hashes is
+        returned for each k-mer.
+        """
+        n_kmers = max(0, len(codes) - k + 1)
+        hashes = np.empty(n_kmers, dtype=np.uint64)
+        mask = np.uint64(0xFFFFFFFFFFFFFFFF) >> np.uint64(64 - 2 * k)
+        two = np.uint64(2)
+        three = np.uint64(3)
+        rc_shift = np.uint64(2 * (k - 1))
+        forward = np.uint64(0)
+        reverse = np.uint64(0)
+        for i in range(len(codes)):
+            code = np.uint64(codes[i])
+            forward = ((forward << two) | code) & mask
+            reverse = (reverse >> two) | ((three - code) << rc_shift)
+            if i >= k - 1:
+                if include_reverse_complement and (reverse < forward):
+                    hashes[i - k + 1] = reverse
+                else:
+                    hashes[i - k + 1] = forward
+        return hashes
+
+    @numba.njit(parallel=True, cache=True)
+    def gc_breach_score(is_gc, window, mini, maxi, n_chunks):
+        """Return the total GC breach and the breaching windows of a sequence.
+
+        Fuses the windowed GC content, the clipping of out-of-bounds values
+        and the final sum in a single pass. The windows are split into chunks
+        processed in parallel, each chunk starting with a full window sum then
+        sliding over its windows.
+
+        Parameters
+        ----------
+
+        is_gc
+          Boolean array, True at the positions of G and C nucleotides.
+
+        window
+          Size of the sliding window.
+
+        mini, maxi
+          Bounds of the GC content (as proportions, e.g. 0.3, 0.7).
+
+        n_chunks
+          Number of chunks of windows processed in parallel, for instance
+          ``4 * numba.get_num_threads()``. It is provided by the caller as
+          functions calling ``numba.get_num_threads()`` cannot be cached.
+
+        Returns
+        -------
+
+        total_breach, is_breach
+          The sum over all windows of the GC content distance to the bounds,
+          and a boolean array, True for the windows out of bounds.
+        """
+        n_windows = max(0, len(is_gc) - window + 1)
+        is_breach = np.zeros(n_windows, dtype=np.bool_)
+        n_chunks = max(1, min(n_chunks, n_windows))
+        chunk_size = (n_windows + n_chunks - 1) // n_chunks
+        chunks_breaches = np.zeros(n_chunks)
+        for chunk in numba.prange(n_chunks):
+            first = chunk * chunk_size
+            last = min(first + chunk_size, n_windows)
+            gc_count = 0
+            for i in range(first, min(first + window, len(is_gc))):
+                gc_count += np.int64(is_gc[i])
+            chunk_breach = 0.0
+            for i in range(first, last):
+                if i > first:
+                    gc_count += np.int64(is_gc[i + window - 1])
+                    gc_count -= np.int64(is_gc[i - 1])
+                gc = gc_count / window
+                breach = max(0.0, mini - gc) + max(0.0, gc - maxi)
+                if breach > 0:
+                    is_breach[i] = True
+                    chunk_breach += breach
+            chunks_breaches[chunk] = chunk_breach
+        return chunks_breaches.sum(), is_breach
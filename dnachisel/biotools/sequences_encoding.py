@@ -0,0 +1,230 @@
+"""Numerical encodings of DNA sequences, for vectorized computations."""
+
+import numpy as np
+
+from .biotables import COMPLEMENTS
+
+
+def sequence_to_uint8_array(sequence):
+    """Return the ASCII codes of an ATGC sequence as a uint8 numpy array.
+
+    For instance ``sequence_to_uint8_array("ATGC")`` returns
+    ``array([65, 84, 71, 67], dtype=uint8)``. If the provided sequence is
+    already a numpy array, it is returned unchanged.
+
+    The array returned for a string is read-only as it shares the memory of
+    the encoded string.
+    """
+    if isinstance(sequence, np.ndarray):
+        return sequence
+    if isinstance(sequence, bytes):
+        return np.frombuffer(sequence, dtype="uint8")
+    return np.frombuffer(str(sequence).encode(), dtype="uint8")
+
+
+NUCLEOTIDES_TO_2BIT_CODES = np.full(256, 255, dtype="uint8")
+for _code, _nucleotide in enumerate("ACGT"):
+    NUCLEOTIDES_TO_2BIT_CODES[ord(_nucleotide)] = _code
+
+MAX_PACKED_KMER_SIZE = 32  # 2 bits per nucleotide in a 64-bit integer
+
+ASCII_COMPLEMENTS = np.arange(256, dtype="uint8")
+for _nucleotide, _complement in COMPLEMENTS.items():
+    ASCII_COMPLEMENTS[ord(_nucleotide)] = ord(_complement)
+
+
+def sequence_to_2bit_codes(sequence):
+    """Return an array of codes 0, 1, 2, 3 for nucleotides A, C, G, T.
+
+    The sequence can be a string or a uint8 array of ASCII codes. Returns None
+    if the sequence has characters other than A, T, G, C (e.g. "N"), which
+    cannot be represented with 2 bits.
+
+    As the codes follow alphabetical order, comparing the packed k-mers of two
+    sequences (see ``kmers_hashes``) is equivalent to comparing the strings.
+    """
+    codes = NUCLEOTIDES_TO_2BIT_CODES.take(sequence_to_uint8_array(sequence))
+    if (codes == 255).any():
+        return None
+    return codes
+
+
+def kmers_hashes(codes, k):
+    """Return the 2-bit-packed integers of all k-mers of a sequence.
+
+    Parameters
+    ----------
+
+    codes
+      An array of 2-bit codes as returned by ``sequence_to_2bit_codes``.
+
+    k
+      Size of the k-mers, at most ``MAX_PACKED_KMER_SIZE`` (32).
+
+    Returns
+    -------
+
+    hashes
+      A uint64 array of size ``len(codes) - k + 1`` where the i-th element
+      represents the k-mer starting at index i. Two k-mers are equal if and
+      only if their hashes are equal.
+    """
+    if k > MAX_PACKED_KMER_SIZE:
+        raise ValueError(
+            "Cannot pack k-mers longer than %d bp" % MAX_PACKED_KMER_SIZE
+        )
+    n_kmers = max(0, len(codes) - k + 1)
+    hashes = np.zeros(n_kmers, dtype="uint64")
+    if n_kmers == 0:
+        return hashes
+    for i in range(k):
+        hashes <<= np.uint64(2)
+        hashes |= codes[i : i + n_kmers]
+    return hashes
+
+
+def reverse_complement_uint8_array(sequence):
+    """Return the reverse-complement of a uint8 array of ASCII nucleotides.
+
+    This is the array equivalent of ``reverse_complement``, without any
+    string allocation (the sequence can also be provided as a string).
+    """
+    return ASCII_COMPLEMENTS.take(sequence_to_uint8_array(sequence))[::-1]
+
+
+def reverse_complement_2bit_codes(codes):
+    """Return the 2-bit codes of the reverse-complement of a sequence.
+
+    With A=0, C=1, G=2, T=3 the complement of a code ``c`` is ``3 - c``.
+    """
+    return (3 - codes)[::-1]
+
+
+def pack_2bit_codes(codes):
+    """Pack 2-bit nucleotide codes into an array of uint64 words.
+
+    Each word holds 32 nucleotides, the first nucleotide being in the most
+    significant bits. The last word is padded with zeros (i.e. "A"s) on the
+    right.
+    """
+    n_words = (len(codes) + 31) // 32
+    padded = np.zeros(32 * n_words, dtype="uint64")
+    padded[: len(codes)] = codes
+    padded = padded.reshape((n_words, 32))
+    words = np.zeros(n_words, dtype="uint64")
+    for i in range(32):
+        words <<= np.uint64(2)
+        words |= padded[:, i]
+    return words
+
+
+_MASK_2BITS = np.uint64(0x3333333333333333)
+_MASK_4BITS = np.uint64(0x0F0F0F0F0F0F0F0F)
+
+
+def reverse_complement_packed(packed, n_nucleotides):
+    """Return the reverse-complement of a sequence packed with 2 bits/nucleotide.
+
+    Uses bit-parallel operations on whole 64-bit words: the complement is a
+    bitwise NOT (A=00 <=> T=11, C=01 <=> G=10), and each word is reversed by
+    swapping 2-bit pairs, then nibbles, then bytes. The result follows the
+    same layout as ``pack_2bit_codes``.
+
+    Parameters
+    ----------
+
+    packed
+      A uint64 array as returned by ``pack_2bit_codes``.
+
+    n_nucleotides
+      Length of the packed sequence (needed to discard the padding).
+    """
+    words = ~packed
+    words = ((words >> np.uint64(2)) & _MASK_2BITS) | (
+        (words & _MASK_2BITS) << np.uint64(2)
+    )
+    words = ((words >> np.uint64(4)) & _MASK_4BITS) | (
+        (words & _MASK_4BITS) << np.uint64(4)
+    )
+    words = words.byteswap()[::-1]
+    padding = 2 * (-n_nucleotides % 32)
+    if padding:
+        # The padding is now at the start, shift all bits to the left.
+        next_words = np.zeros(len(words), dtype="uint64")
+        next_words[:-1] = words[1:]
+        words = (words << np.uint64(padding)) | (
+            next_words >> np.uint64(64 - padding)
+        )
+    return words
+
+
+def canonical_kmers_hashes(codes, k, include_reverse_complement=True):
+    """Return the hashes of all k-mers, possibly merged with their reverse
+    complements.
+
+    If ``include_reverse_complement`` is True, each k-mer is represented by
+    the smallest of its hash and the hash of its reverse-complement, so that
+    a k-mer and its reverse-complement get the same hash. Otherwise this is
+    the same as ``kmers_hashes``.
+
+    Uses a compiled single-pass kernel when Numba is installed. Otherwise,
+    the hashes of the reverse-complement sequence are computed separately.
+    """
+    # Imported here, as importing Numba noticeably slows "import dnachisel".
+    from . import numba_kernels
+
+    if numba_kernels.NUMBA_AVAILABLE:
+        return numba_kernels.canonical_kmers_hashes(
+            codes, k, include_reverse_complement
+        )
+    hashes = kmers_hashes(codes, k)
+    if include_reverse_complement:
+        reverse_codes = reverse_complement_2bit_codes(codes)
+        reverse_hashes = kmers_hashes(reverse_codes, k)[::-1]
+        hashes = np.minimum(hashes, reverse_hashes)
+    return hashes
+
+
+class SequenceViews(dict):
+    """Numerical views of a same sequence, computed on demand.
+
+    This is a dictionary whose entries are computed at first access and then
+    kept, so that several specifications evaluated on the same sequence can
+    share the same arrays:
+
+    - ``"uint8"``: ASCII codes of the sequence (``sequence_to_uint8_array``).
+    - ``"is_gc"``: boolean array, True at G and C positions.
+    - ``"2bit_codes"``: codes 0-3 for A, C, G, T (``sequence_to_2bit_codes``)
+      or None if the sequence has non-ATGC characters.
+
+    Specifications can also store their own sequence-dependent arrays under
+    other keys (see ``UniquifyAllKmers``).
+
+    The views of a previous version of the sequence can be provided with
+    ``previous``, for computations which can be updated from the previous
+    version rather than redone (see ``UniquifyAllKmers``). Only one previous
+    version is kept.
+
+    Examples
+    --------
+
+    >>> views = SequenceViews("ATTGCGCA")
+    >>> gc_positions = views["is_gc"]
+    """
+
+    def __init__(self, sequence, previous=None):
+        self.sequence = sequence
+        self.previous = previous
+        if previous is not None:
+            # Only keep one previous version, so the views don't pile up.
+            previous.previous = None
+
+    def __missing__(self, key):
+        value = self[key] = self._builders[key](self)
+        return value
+
+    _builders = {
+        "uint8": lambda views: sequence_to_uint8_array(views.sequence),
+        "is_gc": lambda views: (views["uint8"] == 71) | (views["uint8"] == 67),
+        "2bit_codes": lambda views: sequence_to_2bit_codes(views["uint8"]),
+    }
@@ -197,7 +197,7 @@ class EnforceChanges(Specification):
         target = self.reference
         sequence = self.extract_subsequence(problem.sequence)
         equalities = np.nonzero(
-            1 - sequences_differences_array(sequence, target)
+            ~sequences_differences_array(sequence, target)
         )[0]
         if self.indices is not None:
             equalities = self.indices[equalities]
@@ -3,7 +3,7 @@
 import numpy as np
 import re
 
-from ..biotools import gc_content, group_nearby_segments
+from ..biotools import gc_content
 from ..Location import Location
 from ..Specification import Specification, SpecEvaluation
 
@@ -49,6 +49,9 @@ class EnforceGCContent(Specification):
 
     best_possible_score = 0
     locations_span = 50  # The resolution will use locations size
+    # Windowed evaluations on longer sequences use a parallel Numba kernel
+    # (if Numba is installed).
+    numba_min_sequence_length = 100000
     shorthand_name = "gc"
 
     def __init__(
@@ -98,38 +101,81 @@ class EnforceGCContent(Specification):
     def evaluate(self, problem):
         """Return the sum of breaches extent for all windowed breaches."""
         wstart, wend = self.location.start, self.location.end
-        sequence = self.location.extract_sequence(problem.sequence)
-        gc = gc_content(sequence, window_size=self.window)
-        breaches = np.maximum(0, self.mini - gc) + np.maximum(
-            0, gc - self.maxi
+        is_gc = problem.sequence_views()["is_gc"][wstart:wend]
+        use_numba = (self.window is not None) and (
+            len(is_gc) >= self.numba_min_sequence_length
         )
-        score = -breaches.sum()
-        breaches_starts = wstart + (breaches > 0).nonzero()[0]
-
-        if len(breaches_starts) == 0:
-            breaches_locations = []
-        elif len(breaches_starts) == 1:
-            if self.window is not None:
-                start = breaches_starts[0]
-                breaches_locations = [[start, start + self.window]]
-            else:
-                breaches_locations = [[wstart, wend]]
+        if use_numba:
+            # Imported here, as importing Numba noticeably slows
+            # "import dnachisel".
+            from ..biotools import numba_kernels
+
+            use_numba = numba_kernels.NUMBA_AVAILABLE
+        if use_numba:
+            total_breach, is_breach = numba_kernels.gc_breach_score(
+                is_gc,
+                self.window,
+                float(self.mini),
+                float(self.maxi),
+                4 * numba_kernels.numba.get_num_threads(),
+            )
+            score = -total_breach
         else:
-            segments = [(bs, bs + self.window) for bs in breaches_starts]
-            groups = group_nearby_segments(
-                segments, max_start_spread=max(1, self.locations_span)
+            gc = gc_content(is_gc, window_size=self.window)
+            if self.window is None:
+                breaches = np.maximum(0, self.mini - gc) + np.maximum(
+                    0, gc - self.maxi
+                )
+            else:
+                # Compute max(0, mini - gc) + max(0, gc - maxi) with a single
+                # new array, reusing the (temporary) gc array as a buffer.
+                breaches = np.subtract(self.mini, gc)
+                np.maximum(breaches, 0, out=breaches)
+                np.subtract(gc, self.maxi, out=gc)
+                np.maximum(gc, 0, out=gc)
+                np.add(breaches, gc, out=breaches)
+            score = -breaches.sum()
+
+        # Most evaluations happen on compliant sequences. Only look for the
+        # breaches positions when there are some.
+        if score == 0:
+            return SpecEvaluation(
+                self, problem, score, locations=[], message="Passed !"
             )
-            breaches_locations = [
-                (group[0][0], group[-1][-1]) for group in groups
-            ]
 
-        if breaches_locations == []:
-            message = "Passed !"
+        if self.window is None:
+            breaches_locations = [[wstart, wend]]
         else:
-            breaches_locations = [Location(*loc) for loc in breaches_locations]
-            message = "Out of bound on segments " + ", ".join(
-                [str(l) for l in breaches_locations]
+            if not use_numba:
+                is_breach = breaches > 0
+            breaches_starts = wstart + is_breach.nonzero()[0]
+            # Group the (sorted) breaches starts so that each group spans less
+            # than locations_span. Each group ends just before the first start
+            # out of reach of its first element, which is found by a binary
+            # search, so the Python loop runs once per group, not per breach.
+            max_start_spread = max(1, self.locations_span)
+            groups_firsts = [0]
+            while True:
+                group_start = breaches_starts[groups_firsts[-1]]
+                next_first = np.searchsorted(
+                    breaches_starts, group_start + max_start_spread
+                )
+                if next_first == len(breaches_starts):
+                    break
+                groups_firsts.append(next_first)
+            groups_firsts = np.array(groups_firsts)
+            groups_lasts = np.append(groups_firsts[1:], len(breaches_starts))
+            breaches_locations = list(
+                zip(
+                    breaches_starts[groups_firsts].tolist(),
+                    (breaches_starts[groups_lasts - 1] + self.window).tolist(),
+                )
             )
+
+        breaches_locations = [Location(*loc) for loc in breaches_locations]
+        message = "Out of bound on segments " + ", ".join(
+            [str(l) for l in breaches_locations]
+        )
         return SpecEvaluation(
             self, problem, score, locations=breaches_locations, message=message
         )
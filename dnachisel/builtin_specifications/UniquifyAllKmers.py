@@ -1,21 +1,39 @@
 """Implement UniquifyAllKmers(Specification)"""
 
+from array import array
 from collections import defaultdict
+import heapq
+
+import numpy as np
 
 from ..Specification import Specification
 
 # from .VoidSpecification import VoidSpecification
 from ..Specification.SpecEvaluation import SpecEvaluation
-from ..biotools import reverse_complement
+from ..biotools import (
+    reverse_complement,
+    canonical_kmers_hashes,
+    MAX_PACKED_KMER_SIZE,
+)
 from ..Location import Location
 
 from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
+def sequence_reverse_complement(sequence):
+    """Return the reverse-complement of the full sequence, with memoization.
+
+    This way the reverse-complement is computed once per sequence, even when
+    several k-mer extractors (e.g. with different k) are created for it.
+    """
+    return reverse_complement(sequence)
+
+
 def get_kmer_extractor(sequence, include_reverse_complement=True, k=1):
     """Return a function (i => standardized_kmer_string)."""
     if include_reverse_complement:
-        rev_comp_sequence = reverse_complement(sequence)
+        rev_comp_sequence = sequence_reverse_complement(sequence)
         L = len(sequence)
 
         def extract_kmer(i):
@@ -38,9 +56,9 @@ def get_kmer_extractor_cached(sequence, include_reverse_complement=True, k=1):
     This globally cached method enables much faster computations when
     several UniquifyAllKmers functions with equal k are used. 
     """
+    L = len(sequence)
     if include_reverse_complement:
-        rev_comp_sequence = reverse_complement(sequence)
-        L = len(sequence)
+        rev_comp_sequence = sequence_reverse_complement(sequence)
 
         @lru_cache(maxsize=L)
         def extract_kmer(i):
@@ -57,6 +75,78 @@ def get_kmer_extractor_cached(sequence, include_reverse_complement=True, k=1):
     return extract_kmer
 
 
+def get_canonical_kmers_hashes(views, k, include_reverse_complement=True):
+    """Return the canonical hashes of all k-mers of a sequence, with caching.
+
+    The hashes (see ``biotools.canonical_kmers_hashes``) are stored in the
+    sequence views, so that specifications with the same k share them.
+
+    If the views of the previous version of the sequence (``views.previous``)
+    have hashes for the same k, they are reused. During an optimization the
+    new sequence is often a variant of the previous one with a few local
+    mutations, in which case only the hashes of the k-mers overlapping the
+    mutated region are recomputed.
+
+    Parameters
+    ----------
+
+    views
+      A ``SequenceViews`` of a sequence with only ATGC characters, e.g. from
+      ``problem.sequence_views()``.
+
+    k
+      Size of the k-mers, at most 32.
+
+    include_reverse_complement
+      Whether k-mers and their reverse-complements should get the same hash.
+    """
+    key = ("canonical_kmers_hashes", k, include_reverse_complement)
+    if key in views:
+        return views[key]
+    codes = views["2bit_codes"]
+    hashes = None
+    previous = views.previous
+    if (
+        (previous is not None)
+        and (key in previous)
+        and (len(previous["2bit_codes"]) == len(codes))
+    ):
+        previous_codes, previous_hashes = previous["2bit_codes"], previous[key]
+        changes = (previous_codes != codes).nonzero()[0]
+        if len(changes) == 0:
+            hashes = previous_hashes
+        else:
+            first = max(0, changes[0] - k + 1)
+            last = min(len(previous_hashes), changes[-1] + 1)
+            if last - first < len(codes) // 4:
+                hashes = previous_hashes.copy()
+                hashes[first:last] = canonical_kmers_hashes(
+                    codes[first : last + k - 1], k, include_reverse_complement
+                )
+    if hashes is None:
+        hashes = canonical_kmers_hashes(codes, k, include_reverse_complement)
+    views[key] = hashes
+    return hashes
+
+
+def nonunique_hashes_indices(hashes, k=None):
+    """Return the (sorted) indices of the hashes appearing several times.
+
+    If the size k of the packed k-mers is provided and the 4^k possible
+    hashes are not much more numerous than the hashes, the occurrences are
+    counted in a flat table of all possible hashes (np.bincount). Otherwise
+    they are counted using np.unique, which sorts the hashes.
+    """
+    if (k is not None) and ((1 << (2 * k)) <= 4 * len(hashes)):
+        hashes = hashes.astype("intp")
+        counts = np.bincount(hashes, minlength=1 << (2 * k))
+        return (counts[hashes] > 1).nonzero()[0]
+    _, inverse, counts = np.unique(
+        hashes, return_inverse=True, return_counts=True
+    )
+    return (counts[inverse] > 1).nonzero()[0]
+
+
 class UniquifyAllKmers(Specification):
     """Avoid sub-sequence of length k with homologies elsewhere.
 
@@ -224,24 +314,30 @@ class UniquifyAllKmers(Specification):
         )
 
     def global_evaluation(self, problem):
-        extract_kmer = self.get_kmer_extractor(problem.sequence)
-        kmers_locations = defaultdict(lambda: [])
         start, end = self.reference.start, self.reference.end
-        for i in range(start, end - self.k):
-            location = (i, i + self.k)
-            kmer_sequence = extract_kmer(i)
-            kmers_locations[kmer_sequence].append(location)
-
-        locations = sorted(
-            [
-                Location(start_, end_)
-                for locations_list in kmers_locations.values()
-                for start_, end_ in locations_list
-                if len(locations_list) > 1
-                and (self.location.start <= start_ < end_ < self.location.end)
-            ],
-            key=lambda l: l.start,
-        )
+        views = problem.sequence_views()
+        codes = None
+        if self.k <= MAX_PACKED_KMER_SIZE:
+            codes = views["2bit_codes"]
+        if codes is not None:
+            hashes = get_canonical_kmers_hashes(
+                views,
+                k=self.k,
+                include_reverse_complement=self.include_reverse_complement,
+            )
+            reference_hashes = hashes[start : max(start, end - self.k + 1)]
+            starts = start + nonunique_hashes_indices(
+                reference_hashes, k=self.k
+            )
+            locations = [
+                Location(start_, start_ + self.k)
+                for start_ in starts.tolist()
+                if self.location.start <= start_
+                and start_ + self.k <= self.location.end
+            ]
+        else:
+            # Pure-Python fallback for long k-mers or non-ATGC sequences.
+            locations = self._python_nonunique_locations(problem)
 
         if locations == []:
             return SpecEvaluation(
@@ -260,6 +356,29 @@ class UniquifyAllKmers(Specification):
             "of non-unique segments %s" % locations,
         )
 
+    def _python_nonunique_locations(self, problem):
+        extract_kmer = self.get_kmer_extractor(problem.sequence)
+        # Only the k-mers starts are stored (the ends are start + k), in
+        # compact integer arrays rather than lists of tuples.
+        kmers_starts = defaultdict(lambda: array("i"))
+        k = self.k
+        for i in range(self.reference.start, self.reference.end - k + 1):
+            kmers_starts[extract_kmer(i)].append(i)
+
+        # Each array of starts is sorted by construction, so they are merged
+        # rather than sorted again.
+        nonunique_starts_arrays = [
+            starts_array
+            for starts_array in kmers_starts.values()
+            if len(starts_array) > 1
+        ]
+        start, end = self.location.start, self.location.end - k
+        return [
+            Location(start_, start_ + k)
+            for start_ in heapq.merge(*nonunique_starts_arrays)
+            if start <= start_ <= end
+        ]
+
     def localized(self, location, problem=None, with_righthand=True):
         """Localize the evaluation."""
 
@@ -271,13 +390,15 @@ class UniquifyAllKmers(Specification):
         k = self.k
         reference = location.extended(k - 1, right=with_righthand)
         changing_kmers_zone = reference.overlap_region(self.reference)
-        changing_kmer_indices = set(changing_kmers_zone.indices[: -k + 1])
+        changing_kmer_indices = set(
+            range(changing_kmers_zone.start, changing_kmers_zone.end - k + 1)
+        )
         localization_data = {}
         for loc, label in [
             (self.location, "location"),
             (self.reference, "extended"),
         ]:
-            kmer_indices = set(loc.indices[: -self.k])
+            kmer_indices = set(range(loc.start, loc.end - k + 1))
             fixed_kmer_indices = kmer_indices.difference(changing_kmer_indices)
             fixed_kmers = set([extract_kmer(i) for i in fixed_kmer_indices])
             changing_inds = kmer_indices.intersection(changing_kmer_indices)
@@ -1,16 +1,12 @@
 import itertools
 
-try:
-    import matplotlib.cm as cm
-
-    MATPLOTLIB_AVAILABLE = True
-except:
-    MATPLOTLIB_AVAILABLE = False
+from .tools import try_import
 
 
 def colors_cycle(lightness_factor=1.0, color_shift=0):
     """Returns an iterator over a range of colors"""
-    if MATPLOTLIB_AVAILABLE:
+    cm = try_import("matplotlib.cm")
+    if cm is not None:
         cycle = itertools.cycle(
             [cm.Paired(color_shift + 0.21 + 0.21 * i % 1.0) for i in range(30)]
         )
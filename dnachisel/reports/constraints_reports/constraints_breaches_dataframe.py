@@ -6,15 +6,52 @@ except ImportError:
     PANDAS_AVAILABLE = False
 
 from ...DnaOptimizationProblem import DnaOptimizationProblem
+from ...builtin_specifications import AvoidPattern
 from ...Location import Location
+from .multipattern_scan import find_patterns_matches
 
-def _breaches(constraint, sequence):
-    problem = DnaOptimizationProblem(sequence, mutation_space={})
-    new_constraint = constraint.initialized_on_problem(problem, role=None)
-    evaluation = new_constraint.evaluate(problem)
-    locations = Location.merge_overlapping_locations(evaluation.locations)
+
+def _locations_to_string(locations):
+    locations = Location.merge_overlapping_locations(locations)
     return ", ".join(map(str, locations))
 
+
+def _sequence_breaches(constraints, sequence):
+    """Return the breaches of all constraints in the sequence, as strings.
+
+    All constraints are evaluated on the same problem, so that the sequence
+    is prepared only once (see ``problem.sequence_views()``), and the patterns
+    of all AvoidPattern constraints are searched in a single scan of the
+    sequence (see ``find_patterns_matches``).
+    """
+    problem = DnaOptimizationProblem(sequence, mutation_space={})
+    constraints = [
+        constraint.initialized_on_problem(problem, role=None)
+        for constraint in constraints
+    ]
+    avoided_patterns = [
+        (i, constraint.pattern, constraint.location)
+        for i, constraint in enumerate(constraints)
+        if isinstance(constraint, AvoidPattern)
+    ]
+    patterns_matches = find_patterns_matches(
+        problem.sequence,
+        [(pattern, location) for (_, pattern, location) in avoided_patterns],
+    )
+    breaches_locations = {
+        i: matches
+        for (i, _, _), matches in zip(avoided_patterns, patterns_matches)
+    }
+    for i, constraint in enumerate(constraints):
+        if i not in breaches_locations:
+            evaluation = constraint.evaluate(problem)
+            breaches_locations[i] = evaluation.locations
+    return [
+        _locations_to_string(breaches_locations[i])
+        for i in range(len(constraints))
+    ]
+
+
 def _install_extras_message(libname):
     return (
         "Could not load %s (is it installed ?). You can install it separately "
@@ -76,19 +113,16 @@ def constraints_breaches_dataframe(
     if hasattr(sequences[0], "id"):
         sequences = [(s.id, s) for s in sequences]
 
+    labels = [
+        constraint.label(
+            use_breach_form=True, with_location=display_constraints_locations,
+        )
+        for constraint in constraints
+    ]
     dataframe_records = [
         dict(
             [("sequence", name)]
-            + [
-                (
-                    constraint.label(
-                        use_breach_form=True,
-                        with_location=display_constraints_locations,
-                    ),
-                    _breaches(constraint, sequence),
-                )
-                for constraint in constraints
-            ]
+            + list(zip(labels, _sequence_breaches(constraints, sequence)))
         )
         for (name, sequence) in sequences
     ]
@@ -10,13 +10,16 @@ Here is a typical example of use:
 >>> cr.breaches_records_to_pdf(records, 'output_breaches_plots.pdf')
 """
 
-from copy import deepcopy
 import re
 from io import BytesIO
 
 import proglog
 
-from ...biotools import sequence_to_biopython_record, annotate_record
+from ...biotools import (
+    sequence_to_biopython_record,
+    annotate_record,
+    copy_record_for_annotation,
+)
 from ...builtin_specifications import (
     EnforceGCContent,
     AvoidPattern,
@@ -26,27 +29,20 @@ from ..colors_cycle import colors_cycle
 
 from .GraphicTranslator import GraphicTranslator
 
-try:
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_pdf import PdfPages
-    MPL_AVAILABLE = True
-except ImportError:
-    MPL_AVAILABLE = False
-
 def _sequences_to_new_records(sequences):
     """Turn acceptable sequences input into a records list.
 
     Acceptable formats are
     - ('name', 'sequence')
     - {'name': 'sequence'}
-    - [records] (will be deepcopied)
+    - [records] (will be copied, see ``copy_record_for_annotation``)
     """
     if isinstance(sequences, dict):
         sequences = list(sequences.items())
     records = []
     for seq in sequences:
         if hasattr(seq, "id"):
-            records.append(deepcopy(seq))
+            records.append(copy_record_for_annotation(seq))
         else:
             name, seq = seq
             records.append(
@@ -137,6 +133,9 @@ def breaches_records_to_pdf(
       Either "bar" for a progress bar, None for no logging, or any Proglog
       logger. The bar name is "sequence".
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+
     pdf_io = BytesIO() if pdf_path is None else pdf_path
     logger = proglog.default_bar_logger(logger, min_time_interval=0.2)
 
@@ -0,0 +1,127 @@
+"""Find the matches of several DNA patterns in a single pass on a sequence.
+
+When the optional Hyperscan library is installed, all DNA-notation patterns
+(enzyme sites, homopolymers, "ATTNNGC"-type patterns, ...) are compiled into a
+single Hyperscan database and the sequence is scanned only once. Other
+patterns (e.g. repeats, which use back-references) and installs without
+Hyperscan fall back to the patterns' own ``find_matches`` method.
+"""
+
+from functools import lru_cache
+
+from ...biotools import reverse_complement
+from ...Location import Location
+from ...SequencePattern import DnaNotationPattern
+
+try:
+    import hyperscan
+
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+def pattern_is_scannable(pattern, location):
+    """Return whether the pattern can be found with Hyperscan.
+
+    DnaNotationPatterns have a fixed size and use only character classes,
+    so all their overlapping matches are reported by Hyperscan. Locations
+    with a strand other than 1, -1 or 0 (e.g. None, for strandless Genbank
+    features) follow special rules in ``find_matches`` and are not scanned.
+    """
+    return isinstance(pattern, DnaNotationPattern) and (
+        location.strand in (-1, 0, 1)
+    )
+
+
+@lru_cache(maxsize=10)
+def _compile_database(expressions):
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[expression.encode() for expression in expressions],
+        ids=list(range(len(expressions))),
+        elements=len(expressions),
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(expressions),
+    )
+    return database
+
+
+def _scanned_strands(pattern, location):
+    """Return (search_forward, search_reverse) for the pattern and location,
+    following the conventions of SequencePattern.find_matches."""
+    if location.strand == 1:
+        return True, False
+    if location.strand == -1:
+        return pattern.is_palyndromic, not pattern.is_palyndromic
+    return True, not pattern.is_palyndromic
+
+
+def find_patterns_matches(sequence, patterns_locations):
+    """Return the matches of several patterns in the sequence.
+
+    Parameters
+    ----------
+
+    sequence
+      A string of "ATGC..."
+
+    patterns_locations
+      A list ``[(pattern, location), ...]`` of SequencePatterns and the
+      Location in which to look for each pattern.
+
+    Returns
+    -------
+
+    matches_lists
+      A list with, for each (pattern, location), the same list of locations as
+      ``pattern.find_matches(sequence, location)``.
+    """
+    matches_lists = [None for _ in patterns_locations]
+    expressions, expressions_targets = [], []
+    for i, (pattern, location) in enumerate(patterns_locations):
+        if not (
+            HYPERSCAN_AVAILABLE and pattern_is_scannable(pattern, location)
+        ):
+            matches_lists[i] = pattern.find_matches(sequence, location)
+            continue
+        forward, reverse = _scanned_strands(pattern, location)
+        matches_lists[i] = {1: [], -1: []}
+        if forward:
+            expressions.append(pattern.expression)
+            expressions_targets.append((i, 1))
+        if reverse:
+            reverse_sequence = reverse_complement(pattern.sequence)
+            expressions.append(
+                DnaNotationPattern.dna_sequence_to_regexpr(reverse_sequence)
+            )
+            expressions_targets.append((i, -1))
+
+    if len(expressions):
+
+        def on_match(expression_id, start, end, flags, context):
+            i, strand = expressions_targets[expression_id]
+            matches_lists[i][strand].append((start, end))
+
+        database = _compile_database(tuple(expressions))
+        database.scan(sequence.encode(), match_event_handler=on_match)
+
+    for i, (pattern, location) in enumerate(patterns_locations):
+        if not isinstance(matches_lists[i], dict):
+            continue
+        forward_matches, reverse_matches = [
+            sorted(
+                (start, end)
+                for (start, end) in matches_lists[i][strand]
+                if location.start <= start and end <= location.end
+            )
+            for strand in (1, -1)
+        ]
+        # As in find_matches, reverse-strand matches are listed in the order
+        # they are found on the reverse-complement sequence.
+        matches_lists[i] = [
+            Location(start, end, 1) for (start, end) in forward_matches
+        ] + [
+            Location(start, end, -1)
+            for (start, end) in reverse_matches[::-1]
+        ]
+    return matches_lists
@@ -15,7 +15,7 @@ from ..biotools import (
 )
 from ..version import __version__
 from .SpecAnnotationsTranslator import SpecAnnotationsTranslator
-from .tools import install_extras_message
+from .tools import install_extras_message, try_import
 from ..Location import Location
 
 try:
@@ -31,17 +31,6 @@ try:
 except ImportError:
     SEQUENTICON_AVAILABLE = False
 
-MATPLOTLIB_AVAILABLE = False
-try:
-    import matplotlib.cm as cm
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_pdf import PdfPages
-
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    pass
-
-
 try:
     from geneblocks import DiffBlocks
 
@@ -98,8 +87,11 @@ def write_no_solution_report(
     error
       A NoSolutionError (carries a message and a location)
     """
-    if not MATPLOTLIB_AVAILABLE:
+    if try_import("matplotlib") is None:
         raise ImportError(install_extras_message("Matplotlib"))
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+
     if isinstance(target, str):
         root = flametree.file_tree(target, replace=True)
     else:
@@ -363,6 +355,8 @@ def write_optimization_report(
     # CREATE FIGURES AND GENBANKS
     diffs_figure_data = None
     if GENEBLOCKS_AVAILABLE and plot_figure:
+        import matplotlib.pyplot as plt
+
         diffs_ax = plot_optimization_changes(problem)
         diffs_figure_data = pdf_tools.figure_data(diffs_ax.figure, fmt="svg")
         plt.close(diffs_ax.figure)
@@ -1,5 +1,23 @@
 import hashlib
 import base64
+import importlib
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def try_import(module_name):
+    """Import and return a module, or return None if it is not installed.
+
+    This is used for the heavy plotting libraries (Matplotlib, etc.) so they
+    are only imported when a report or a plot is actually made, not at
+    ``import dnachisel``. The result is cached, so the import is attempted
+    only once per module.
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
 
 def install_extras_message(libname):
     return (
@@ -46,6 +46,7 @@ setup(
             "matplotlib",
             "dna_features_viewer",
             "pandas",
-        ]
+        ],
+        "speed": ["numba", "hyperscan"],
     },
 )
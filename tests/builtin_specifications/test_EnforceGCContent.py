@@ -6,7 +6,10 @@ from dnachisel import (
     AvoidPattern,
     EnforceGCContent,
 )
+from dnachisel.biotools import numba_kernels
 import numpy
+import pytest
+import warnings
 
 
 def test_EnforceGCContents():
@@ -35,3 +38,50 @@ def test_parameters_from_string():
     ]:
         mini, maxi, target, w = EnforceGCContent.string_to_parameters(pattern)
         assert (mini, maxi, target, w) == expected
+
+
+def test_EnforceGCContent_evaluation_follows_sequence_changes():
+    problem = DnaOptimizationProblem(
+        sequence=100 * "A",
+        constraints=[EnforceGCContent(mini=0.3, maxi=0.7, window=50)],
+        logger=None,
+    )
+    assert not problem.all_constraints_pass()
+    problem.sequence = 50 * "GA"
+    assert problem.all_constraints_pass()
+
+
+@pytest.mark.skipif(
+    not numba_kernels.NUMBA_AVAILABLE, reason="Numba is not installed"
+)
+def test_EnforceGCContent_numba_evaluation():
+    sequence = random_dna_sequence(5000, seed=123)
+    specification = EnforceGCContent(mini=0.45, maxi=0.55, window=30)
+    problem = DnaOptimizationProblem(
+        sequence=sequence, constraints=[specification], logger=None
+    )
+    constraint = problem.constraints[0]
+    numpy_evaluation = constraint.evaluate(problem)
+    constraint.numba_min_sequence_length = 0
+    numba_evaluation = constraint.evaluate(problem)
+    assert numpy.isclose(numba_evaluation.score, numpy_evaluation.score)
+    assert numba_evaluation.message == numpy_evaluation.message
+
+
+@pytest.mark.skipif(
+    not numba_kernels.NUMBA_AVAILABLE, reason="Numba is not installed"
+)
+def test_EnforceGCContent_numba_kernel_is_cachable():
+    sequence = random_dna_sequence(5000, seed=123)
+    specification = EnforceGCContent(mini=0.45, maxi=0.55, window=30)
+    problem = DnaOptimizationProblem(
+        sequence=sequence, constraints=[specification], logger=None
+    )
+    constraint = problem.constraints[0]
+    constraint.numba_min_sequence_length = 0
+    constraint.evaluate(problem)
+    # Recompiling saves the kernel to the cache, which raises a NumbaWarning
+    # if the kernel cannot be cached.
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", numba_kernels.numba.NumbaWarning)
+        numba_kernels.gc_breach_score.recompile()
@@ -3,7 +3,17 @@ from dnachisel import (
     random_dna_sequence,
     UniquifyAllKmers,
 )
+from dnachisel.builtin_specifications.UniquifyAllKmers import (
+    nonunique_hashes_indices,
+)
+from dnachisel.biotools import (
+    numba_kernels,
+    sequence_to_2bit_codes,
+    kmers_hashes,
+    reverse_complement_2bit_codes,
+)
 import numpy
+import pytest
 
 # Note: we are not providing a location for AvoidChanges: it applies globally
 def test_UniquifyAllKmers_as_constraint():
@@ -49,3 +59,88 @@ def test_UniquifyAllKmers_from_polyAs_uncached():
     assert not problem.all_constraints_pass()
     problem.resolve_constraints()
     assert problem.all_constraints_pass()
+
+
+def test_UniquifyAllKmers_vectorized_and_python_evaluations_agree():
+    sequence = random_dna_sequence(2000, seed=123)
+    for include_reverse_complement in [True, False]:
+        for location in [None, (100, 1500)]:
+            specification = UniquifyAllKmers(
+                6,
+                location=location,
+                include_reverse_complement=include_reverse_complement,
+            )
+            problem = DnaOptimizationProblem(
+                sequence=sequence, constraints=[specification], logger=None
+            )
+            constraint = problem.constraints[0]
+            evaluation = constraint.evaluate(problem)
+            assert not evaluation.passes
+            expected = constraint._python_nonunique_locations(problem)
+            assert [l.to_tuple() for l in evaluation.locations] == [
+                l.to_tuple() for l in expected
+            ]
+
+
+@pytest.mark.skipif(
+    not numba_kernels.NUMBA_AVAILABLE, reason="Numba is not installed"
+)
+def test_UniquifyAllKmers_numba_and_numpy_hashes_agree():
+    codes = sequence_to_2bit_codes(random_dna_sequence(3000, seed=123))
+    for k in [1, 5, 8, 32]:
+        numpy_hashes = numpy.minimum(
+            kmers_hashes(codes, k),
+            kmers_hashes(reverse_complement_2bit_codes(codes), k)[::-1],
+        )
+        numba_hashes = numba_kernels.canonical_kmers_hashes(codes, k, True)
+        assert list(numpy_hashes) == list(numba_hashes)
+        numba_hashes = numba_kernels.canonical_kmers_hashes(codes, k, False)
+        assert list(kmers_hashes(codes, k)) == list(numba_hashes)
+
+
+def test_UniquifyAllKmers_incremental_hashes_update():
+    sequence = random_dna_sequence(2000, seed=123)
+    problem = DnaOptimizationProblem(
+        sequence=sequence, constraints=[UniquifyAllKmers(8)], logger=None
+    )
+    constraint = problem.constraints[0]
+    constraint.evaluate(problem)
+    # A local mutation: the hashes get updated incrementally.
+    problem.sequence = sequence[:1000] + "GGGGG" + sequence[1005:]
+    evaluation = constraint.evaluate(problem)
+    expected = constraint._python_nonunique_locations(problem)
+    assert [l.to_tuple() for l in evaluation.locations] == [
+        l.to_tuple() for l in expected
+    ]
+    # The previous hashes are kept by the problem, for one sequence only.
+    views = problem.sequence_views()
+    assert ("canonical_kmers_hashes", 8, True) in views.previous
+    assert views.previous.previous is None
+
+
+def test_UniquifyAllKmers_last_kmer_is_considered():
+    # The first k-mer is repeated only as the very last k-mer of the sequence.
+    # k=33 is evaluated with the pure-Python fallback.
+    for kmer in ["ACG", random_dna_sequence(33, seed=123)]:
+        k = len(kmer)
+        sequence = kmer + "TTT" + kmer
+        specification = UniquifyAllKmers(k, include_reverse_complement=False)
+        problem = DnaOptimizationProblem(
+            sequence=sequence, constraints=[specification], logger=None
+        )
+        evaluation = problem.constraints[0].evaluate(problem)
+        assert [(l.start, l.end) for l in evaluation.locations] == [
+            (0, k),
+            (k + 3, 2 * k + 3),
+        ]
+
+
+def test_UniquifyAllKmers_bincount_and_unique_counts_agree():
+    codes = sequence_to_2bit_codes(random_dna_sequence(20000, seed=123))
+    for k in [4, 6, 8]:
+        hashes = kmers_hashes(codes, k)
+        assert (1 << (2 * k)) <= 4 * len(hashes)  # the bincount path is used
+        with_bincount = nonunique_hashes_indices(hashes, k=k)
+        with_unique = nonunique_hashes_indices(hashes)
+        assert len(with_unique) > 0
+        assert (with_bincount == with_unique).all()
@@ -12,6 +12,16 @@ from dnachisel.biotools import (
     translate,
     list_common_enzymes,
     reverse_translate,
+    gc_content,
+    sequence_to_uint8_array,
+    sequence_to_2bit_codes,
+    pack_2bit_codes,
+    reverse_complement,
+    reverse_complement_packed,
+    reverse_complement_uint8_array,
+    random_dna_sequence,
+    SequenceViews,
+    copy_record_for_annotation,
 )
 
 data_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "data")
@@ -81,3 +91,46 @@ def reverse_translate_with_tables():
         rv_translation = reverse_translate(protein, table=table)
         assert rv_translation == expected
         assert translate(rv_translation, table=table) == protein
+
+
+def test_gc_content_on_encoded_sequence():
+    sequence = "ATGCGGCATTAGCC"
+    encoded = sequence_to_uint8_array(sequence)
+    assert gc_content(encoded) == gc_content(sequence)
+    assert gc_content(sequence.encode()) == gc_content(sequence) == 8 / 14
+    assert list(gc_content(encoded, window_size=4)) == list(
+        gc_content(sequence, window_size=4)
+    )
+
+
+def test_reverse_complement_of_encoded_sequences():
+    for length in [1, 31, 32, 33, 100]:
+        sequence = random_dna_sequence(length, seed=length)
+        rev_comp = reverse_complement(sequence)
+        rev_comp_array = reverse_complement_uint8_array(sequence)
+        assert rev_comp_array.tobytes().decode() == rev_comp
+        packed = pack_2bit_codes(sequence_to_2bit_codes(sequence))
+        expected = pack_2bit_codes(sequence_to_2bit_codes(rev_comp))
+        result = reverse_complement_packed(packed, length)
+        assert list(result) == list(expected)
+
+
+def test_sequence_views():
+    views = SequenceViews("ATGCN")
+    assert list(views["is_gc"]) == [False, False, True, True, False]
+    assert views["2bit_codes"] is None
+    views = SequenceViews("ATGC")
+    assert list(views["2bit_codes"]) == [0, 3, 2, 1]
+    assert views["2bit_codes"] is views["2bit_codes"]
+
+
+def test_copy_record_for_annotation():
+    record = sequence_to_biopython_record("ATGCATGCATGC")
+    record.linear = False
+    annotate_record(record, (0, 5), label="my_label")
+    new_record = copy_record_for_annotation(record)
+    assert new_record.linear is False
+    annotate_record(new_record, (5, 10), label="new_label")
+    assert len(record.features) == 1
+    assert len(new_record.features) == 2
+    assert new_record.seq == record.seq
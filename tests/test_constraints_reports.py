@@ -33,3 +33,27 @@ def test_constraints_reports():
     pdf_data = cr.breaches_records_to_pdf(records)
     
     assert 70000 < len(pdf_data) < 80000
+
+
+def test_find_patterns_matches():
+    from dnachisel.reports.constraints_reports.multipattern_scan import (
+        find_patterns_matches,
+    )
+
+    sequence = dc.random_dna_sequence(5000, seed=123)
+    patterns_locations = [
+        (dc.SequencePattern.from_string(pattern), location)
+        for pattern in ["BsaI_site", "GAATTC", "5xA", "ATTNNGC", "3x2mer"]
+        for location in [
+            dc.Location(0, 5000, 0),
+            dc.Location(100, 4000, 1),
+            dc.Location(50, 4900, -1),
+            dc.Location(200, 3000, None),
+        ]
+    ]
+    all_matches = find_patterns_matches(sequence, patterns_locations)
+    for (pattern, location), matches in zip(patterns_locations, all_matches):
+        expected = pattern.find_matches(sequence, location)
+        assert [m.to_tuple() for m in matches] == [
+            m.to_tuple() for m in expected
+        ]